@@ -4,15 +4,20 @@ Agent configuration classes.
 
 from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.types import PositiveFloat, PositiveInt
 
 from .base import EnvSubstitutionMixin
 
+# Accepted system prompt file extensions
+_PROMPT_EXTENSIONS = (".md", ".txt")
+
 
 class SystemPromptConfig(BaseModel, EnvSubstitutionMixin):
     """Configuration for system prompts."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(..., description="Prompt version")
     path: str = Field(..., description="Path to prompt file")
 
@@ -26,7 +31,7 @@ class SystemPromptConfig(BaseModel, EnvSubstitutionMixin):
     @classmethod
     def validate_prompt_path(cls, v: str) -> str:
         """Validate that prompt path has correct extension."""
-        if not v.endswith(".md") and not v.endswith(".txt"):
+        if not v.endswith(_PROMPT_EXTENSIONS):
             raise ValueError("Prompt path must end with .md or .txt")
         return v
 
@@ -34,6 +39,8 @@ class SystemPromptConfig(BaseModel, EnvSubstitutionMixin):
 class AgentModelConfig(BaseModel, EnvSubstitutionMixin):
     """Configuration for agent model settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Model name reference")
     temperature: Optional[PositiveFloat] = Field(None, description="Override temperature")
     max_tokens: Optional[PositiveInt] = Field(None, description="Override max tokens")
@@ -65,6 +72,8 @@ class AgentModelConfig(BaseModel, EnvSubstitutionMixin):
 class AgentConfig(BaseModel, EnvSubstitutionMixin):
     """Configuration for AI agents."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(..., description="Agent version")
     name: str = Field(..., description="Agent name")
     description: str = Field(..., description="Agent description")
@@ -83,9 +92,8 @@ class AgentConfig(BaseModel, EnvSubstitutionMixin):
     @classmethod
     def validate_tools(cls, v: List[str]) -> List[str]:
         """Validate tool references format."""
+        # Item types are already enforced by the List[str] core schema
         for tool in v:
-            if not isinstance(tool, str):
-                raise ValueError("Tool references must be strings")
             # Validate tool reference format (e.g., "ai_foundry.tools.bing")
             if "." not in tool:
                 raise ValueError(f"Tool reference '{tool}' must be in format " "'category.subcategory.name'")
@@ -4,7 +4,7 @@ Main AI configuration class.
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .agent_config import AgentConfig
 from .base import EnvSubstitutionMixin
@@ -15,6 +15,8 @@ from .tool_config import ToolsConfig
 class AIConfig(BaseModel, EnvSubstitutionMixin):
     """Main configuration class for AI system."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(..., description="Configuration version")
     models: Dict[str, ModelConfig] = Field(default_factory=dict, description="Model configurations")
     tools: ToolsConfig = Field(default_factory=ToolsConfig, description="Tools configuration")
@@ -45,46 +47,22 @@ class AIConfig(BaseModel, EnvSubstitutionMixin):
     @model_validator(mode="after")
     def validate_cross_references(self) -> "AIConfig":
         """Validate cross-references between agents, models, and tools."""
+        # Model names are the keys of the models dict, so membership checks
+        # need no separate set. Tool references are not validated here, as
+        # the tool structure is complex and references are resolved on load.
         models = self.models
-        tools_config = self.tools
-        agents = self.agents
-
-        # Extract available model names
-        available_models = set(models.keys()) if models else set()
-
-        # Extract available tool names from nested structure
-        available_tools: set[str] = set()
-        if tools_config.openapi:
-            available_tools.update(tools_config.openapi.keys())
-        if tools_config.ai_foundry and tools_config.ai_foundry.tools:
-            available_tools.update(tools_config.ai_foundry.tools.keys())
-
-        # Validate agent references
-        for agent_name, agent_config in agents.items():
-            # Check model reference
-            if agent_config.model and agent_config.model.name:
-                model_name = agent_config.model.name
-                if model_name not in available_models:
-                    raise ValueError(
-                        f"Agent '{agent_name}' references unknown model " f"'{model_name}'. Available models: " f"{sorted(available_models)}"
-                    )
-
-            # Check tool references
-            if agent_config.tools:
-                for tool_ref in agent_config.tools:
-                    if tool_ref not in available_tools:
-                        # For now, just warn rather than error for tool
-                        # references as the tool structure is complex
-                        pass
+
+        # Validate agent model references
+        for agent_name, agent_config in self.agents.items():
+            model_name = agent_config.model.name
+            if model_name and model_name not in models:
+                raise ValueError(f"Agent '{agent_name}' references unknown model " f"'{model_name}'. Available models: " f"{sorted(models)}")
 
         return self
 
     def get_model(self, name: str) -> Optional[ModelConfig]:
         """Get a model configuration by name."""
-        models = getattr(self, "models", None)
-        if isinstance(models, dict):
-            return models.get(name)
-        return None
+        return self.models.get(name)
 
     def get_agent(self, name: str) -> Optional[AgentConfig]:
         """Get an agent configuration by name."""
@@ -92,8 +70,8 @@ class AIConfig(BaseModel, EnvSubstitutionMixin):
 
     def list_models(self) -> List[str]:
         """List all available model names."""
-        return list(self.models.keys())
+        return list(self.models)
 
     def list_agents(self) -> List[str]:
         """List all available agent names."""
-        return list(self.agents.keys())
+        return list(self.agents)
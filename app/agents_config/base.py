@@ -4,7 +4,182 @@ Base mixin for environment variable substitution and reference resolution.
 
 import os
 import re
-from typing import Any, Dict
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Pattern to match ${env:VAR_NAME}; strings without the marker skip the regex
+_ENV_VAR_MARKER = "${env:"
+_ENV_VAR_PATTERN = re.compile(r"\$\{env:([^}]+)\}")
+
+# Pattern to match ${ref:path.to.value}; strings without the marker skip the regex
+_REF_MARKER = "${ref:"
+_REF_PATTERN = re.compile(r"\$\{ref:([^}]+)\}")
+
+
+def _replace_env_var(env_cache: Dict[str, str], match: re.Match[str]) -> str:
+    """Return the environment value for a matched ${env:VAR_NAME} placeholder."""
+    env_var = match.group(1)
+    env_value = env_cache.get(env_var)
+    if env_value is None:
+        env_value = os.getenv(env_var)
+        if env_value is None:
+            raise ValueError(f"Environment variable '{env_var}' not found")
+        env_cache[env_var] = env_value
+    return env_value
+
+
+def _substitute_env_string(env_cache: Dict[str, str], value: str) -> str:
+    """Substitute ${env:VAR_NAME} placeholders in a single string."""
+    if _ENV_VAR_MARKER not in value:
+        return value
+    return _ENV_VAR_PATTERN.sub(partial(_replace_env_var, env_cache), value)
+
+
+def _iter_marked_strings(value: Any, marker: str) -> Iterator[str]:
+    """
+    Yield every string containing marker in a nested dict/list structure.
+
+    The walk uses an explicit stack and keeps the ids of the containers
+    enclosing the current one, so a structure that contains itself (e.g.
+    the YAML ``a: &x [*x]``) is reported instead of being walked forever.
+    A container shared by several parents, as with a YAML anchor used
+    twice, is walked once per parent.
+
+    Raises:
+        ValueError: If the structure contains itself
+    """
+    if isinstance(value, str):
+        if marker in value:
+            yield value
+        return
+    if not isinstance(value, (dict, list)):
+        return
+    path: List[int] = []
+    on_path: Set[int] = set()
+    stack: List[Tuple[Any, int]] = [(value, 0)]
+    while stack:
+        container, depth = stack.pop()
+        # Drop the containers that are not ancestors of this one
+        while len(path) > depth:
+            on_path.discard(path.pop())
+        container_id = id(container)
+        if container_id in on_path:
+            raise ValueError("Configuration contains a cyclic reference")
+        path.append(container_id)
+        on_path.add(container_id)
+        depth += 1
+        for item in container.values() if isinstance(container, dict) else container:
+            if isinstance(item, str):
+                if marker in item:
+                    yield item
+            elif isinstance(item, (dict, list)):
+                stack.append((item, depth))
+
+
+def find_env_vars(value: Any) -> Set[str]:
+    """
+    Find the names of environment variables referenced as ${env:VAR_NAME}.
+
+    Args:
+        value: The value to scan (can be str, dict, list, etc.)
+
+    Returns:
+        The set of referenced environment variable names
+
+    Raises:
+        ValueError: If the value contains itself
+    """
+    env_vars: Set[str] = set()
+    for item in _iter_marked_strings(value, _ENV_VAR_MARKER):
+        env_vars.update(_ENV_VAR_PATTERN.findall(item))
+    return env_vars
+
+
+def _copy_container(container: Any) -> Any:
+    """Return a shallow copy of a dict or list."""
+    return dict(container) if isinstance(container, dict) else list(container)
+
+
+def _map_strings(value: Any, transform: Callable[[str], Any], marker: Optional[str] = None) -> Any:
+    """
+    Apply a transform to every string in a nested dict/list structure.
+
+    Dicts and lists are copied rather than mutated. When marker is given,
+    only strings containing it are transformed, and a container is copied
+    only once a string below it changes; the rest are shared with the
+    input. The walk uses an explicit stack, so deeply nested
+    configurations cost no Python frames per level, and each container
+    is handled a fixed number of times regardless of its depth.
+
+    Args:
+        value: The value to process (can be str, dict, list, etc.)
+        transform: Function applied to each string leaf
+        marker: Optional substring that strings must contain to be changed
+
+    Returns:
+        The value with every string leaf transformed
+
+    Raises:
+        ValueError: If the structure contains itself
+    """
+    if isinstance(value, str):
+        return transform(value)
+    if not isinstance(value, (dict, list)):
+        return value
+    # Most inputs hold no marker at all (e.g. data already substituted by a
+    # parent model's validator); a scan that stops at the first hit settles
+    # that without setting up the copy
+    if marker is not None and next(_iter_marked_strings(value, marker), None) is None:
+        return value
+
+    copy_all = marker is None
+    # Frames of the containers enclosing the current one, as in
+    # _iter_marked_strings; each is [original, copy or None, key in parent, depth]
+    path: List[List[Any]] = []
+    on_path: Set[int] = set()
+    root = [value, _copy_container(value) if copy_all else None, None, 0]
+    stack: List[List[Any]] = [root]
+    while stack:
+        frame = stack.pop()
+        container = frame[0]
+        while len(path) > frame[3]:
+            on_path.discard(id(path.pop()[0]))
+        if id(container) in on_path:
+            raise ValueError("Configuration contains a cyclic reference")
+        if copy_all and path:
+            frame[1] = path[-1][1][frame[2]] = _copy_container(container)
+        path.append(frame)
+        on_path.add(id(container))
+
+        entries = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, item in entries:
+            if isinstance(item, str):
+                if marker is not None and marker not in item:
+                    continue
+                new_item = transform(item)
+                if new_item is item:
+                    continue
+                if frame[1] is None:
+                    # Copy the uncopied ancestors, outermost first, linking
+                    # each copy into its parent's copy
+                    first = len(path)
+                    while first and path[first - 1][1] is None:
+                        first -= 1
+                    for index in range(first, len(path)):
+                        path[index][1] = _copy_container(path[index][0])
+                        if index:
+                            path[index - 1][1][path[index][2]] = path[index][1]
+                frame[1][key] = new_item
+            elif isinstance(item, (dict, list)):
+                stack.append([item, None, key, len(path)])
+
+    return value if root[1] is None else root[1]
+
+
+def _detach(value: Any) -> Any:
+    """Copy the dicts and lists of a resolved reference so it never aliases its source."""
+    # Leaves are immutable scalars, so only the containers need copying
+    return _map_strings(value, lambda item: item)
 
 
 class EnvSubstitutionMixin:
@@ -13,7 +188,11 @@ class EnvSubstitutionMixin:
     @staticmethod
     def substitute_env_vars(value: Any) -> Any:
         """
-        Recursively substitute environment variables in format ${env:VAR_NAME}.
+        Substitute environment variables in format ${env:VAR_NAME}.
+
+        Nested dicts and lists are walked iteratively; see _map_strings.
+        Only containers holding a placeholder are copied, the rest are
+        shared with the input.
 
         Args:
             value: The value to process (can be str, dict, list, etc.)
@@ -22,26 +201,13 @@ class EnvSubstitutionMixin:
             The value with environment variables substituted
 
         Raises:
-            ValueError: If an environment variable is not found
+            ValueError: If an environment variable is not found or the
+                value contains itself
         """
-        if isinstance(value, str):
-            # Pattern to match ${env:VAR_NAME}
-            pattern = r"\$\{env:([^}]+)\}"
-
-            def replace_env_var(match: re.Match[str]) -> str:
-                env_var = match.group(1)
-                env_value = os.getenv(env_var)
-                if env_value is None:
-                    raise ValueError(f"Environment variable '{env_var}' not found")
-                return env_value
-
-            return re.sub(pattern, replace_env_var, value)
-        elif isinstance(value, dict):
-            return {k: EnvSubstitutionMixin.substitute_env_vars(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [EnvSubstitutionMixin.substitute_env_vars(item) for item in value]
-        else:
-            return value
+        # Containers without placeholders, e.g. data already substituted by a
+        # parent model's validator or by ConfigLoader, are returned as-is.
+        # Lookups are cached for this call only, so later calls see env changes.
+        return _map_strings(value, partial(_substitute_env_string, {}), _ENV_VAR_MARKER)
 
 
 class ReferenceResolutionMixin:
@@ -50,7 +216,11 @@ class ReferenceResolutionMixin:
     @staticmethod
     def resolve_references(value: Any, config_dict: Dict[str, Any]) -> Any:
         """
-        Recursively resolve internal references in format ${ref:path.to.value}.
+        Resolve internal references in format ${ref:path.to.value}.
+
+        Nested dicts and lists are walked iteratively; see _map_strings.
+        Resolved paths are memoized for the duration of the call, so a path
+        referenced from many places is only walked once.
 
         Args:
             value: The value to process (can be str, dict, list, etc.)
@@ -61,41 +231,49 @@ class ReferenceResolutionMixin:
             The value with internal references resolved
 
         Raises:
-            ValueError: If a reference path is not found
+            ValueError: If a reference path is not found or the value
+                contains itself
         """
-        if isinstance(value, str):
-            # Pattern to match ${ref:path.to.value}
-            pattern = r"\$\{ref:([^}]+)\}"
-
-            def replace_reference(match: re.Match[str]) -> str:
-                ref_path = match.group(1)
-                resolved_value = ReferenceResolutionMixin._resolve_path(ref_path, config_dict)
-                if resolved_value is None:
-                    raise ValueError(f"Reference path '{ref_path}' not found in configuration")
-                return str(resolved_value)
-
-            # Also handle simple references without ${ref:} wrapper
-            # for backward compatibility with existing patterns
-            if value in config_dict:
-                return config_dict[value]
-
-            # Handle dot notation references like "ai_foundry.tools.opoint_api"
-            if "." in value and not value.startswith("${"):
-                try:
-                    resolved = ReferenceResolutionMixin._resolve_path(value, config_dict)
-                    if resolved is not None:
-                        return resolved
-                except (KeyError, TypeError):
-                    pass  # Not a reference, return as-is
-
-            return re.sub(pattern, replace_reference, value)
-        elif isinstance(value, dict):
-            return {k: ReferenceResolutionMixin.resolve_references(v, config_dict) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [ReferenceResolutionMixin.resolve_references(item, config_dict) for item in value]
-        else:
+        # Every container is copied (no marker), as plain dot-notation strings
+        # resolve too. Resolved values are not walked again, and resolved
+        # containers are copied so the result shares nothing with the input.
+        path_cache: Dict[str, Any] = {}
+        return _map_strings(value, partial(ReferenceResolutionMixin._resolve_string, config_dict, path_cache))
+
+    @staticmethod
+    def _resolve_string(config_dict: Dict[str, Any], path_cache: Dict[str, Any], value: str) -> Any:
+        """Resolve references in a single string using a shared path cache."""
+        # Also handle simple references without ${ref:} wrapper
+        # for backward compatibility with existing patterns
+        if value in config_dict:
+            return _detach(config_dict[value])
+
+        # Handle dot notation references like "ai_foundry.tools.opoint_api"
+        if "." in value and not value.startswith("${"):
+            resolved = ReferenceResolutionMixin._resolve_cached_path(value, config_dict, path_cache)
+            if resolved is not None:
+                return _detach(resolved)
+
+        if _REF_MARKER not in value:
             return value
 
+        def replace_reference(match: re.Match[str]) -> str:
+            ref_path = match.group(1)
+            resolved_value = ReferenceResolutionMixin._resolve_cached_path(ref_path, config_dict, path_cache)
+            if resolved_value is None:
+                raise ValueError(f"Reference path '{ref_path}' not found in configuration")
+            return str(resolved_value)
+
+        return _REF_PATTERN.sub(replace_reference, value)
+
+    @staticmethod
+    def _resolve_cached_path(path: str, config_dict: Dict[str, Any], path_cache: Dict[str, Any]) -> Any:
+        """Resolve a dot-notation path, memoizing hits and misses in path_cache."""
+        if path in path_cache:
+            return path_cache[path]
+        resolved = path_cache[path] = ReferenceResolutionMixin._resolve_path(path, config_dict)
+        return resolved
+
     @staticmethod
     def _resolve_path(path: str, config_dict: Dict[str, Any]) -> Any:
         """
@@ -4,13 +4,21 @@ Configuration loader utilities.
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-import yaml
 from pydantic import ValidationError
 
 from .ai_config import AIConfig
-from .base import EnvSubstitutionMixin, ReferenceResolutionMixin
+from .base import EnvSubstitutionMixin, ReferenceResolutionMixin, find_env_vars
+
+# Parsed YAML documents keyed by absolute path, stored with the file's
+# (st_ino, st_size, st_mtime_ns, st_ctime_ns) so an edited file is parsed
+# again. The inode and ctime catch a same-size rewrite that keeps the old
+# mtime, e.g. a replace by rename or a copy that preserves timestamps.
+# Holds at most _PARSED_YAML_CACHE_SIZE files; the least recently parsed
+# one is evicted.
+_PARSED_YAML_CACHE: Dict[str, Tuple[Tuple[int, int, int, int], Any]] = {}
+_PARSED_YAML_CACHE_SIZE = 32
 
 
 class ConfigLoader:
@@ -36,11 +44,31 @@ class ConfigLoader:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                raw_config = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Failed to parse YAML file {config_path}: {e}")
+        # Reuse the parsed document while the file is unchanged. Neither
+        # resolution pass below mutates its input, and reference resolution
+        # copies every container, including those a reference resolves to,
+        # so no part of the cached document reaches the returned AIConfig.
+        # Environment variables are still read on every load.
+        cache_key = str(config_file.resolve())
+        stat = config_file.stat()
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+        cached = _PARSED_YAML_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            raw_config = cached[1]
+        else:
+            # yaml is imported on first parse so that importing the package
+            # stays cheap; prefer the libyaml-backed loader when available
+            import yaml
+
+            try:
+                with open(config_file, "r", encoding="utf-8") as f:
+                    raw_config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            except yaml.YAMLError as e:
+                raise yaml.YAMLError(f"Failed to parse YAML file {config_path}: {e}")
+            _PARSED_YAML_CACHE.pop(cache_key, None)
+            if len(_PARSED_YAML_CACHE) >= _PARSED_YAML_CACHE_SIZE:
+                del _PARSED_YAML_CACHE[next(iter(_PARSED_YAML_CACHE))]
+            _PARSED_YAML_CACHE[cache_key] = (signature, raw_config)
 
         if raw_config is None:
             raise ValueError(f"Configuration file {config_path} is empty")
@@ -56,6 +84,11 @@ class ConfigLoader:
         except ValidationError as e:
             raise ValueError(f"Configuration validation failed for {config_path}: {e}")
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all parsed YAML documents cached by load_from_file."""
+        _PARSED_YAML_CACHE.clear()
+
     @staticmethod
     def load_from_dict(config_dict: Dict[str, Any]) -> AIConfig:
         """
@@ -92,31 +125,13 @@ class ConfigLoader:
         Returns:
             List of missing environment variable names
         """
-        import re
-
         missing_vars = []
 
-        def extract_env_vars(value: Any) -> List[str]:
-            """Extract environment variable names from a value."""
-            env_vars = []
-            if isinstance(value, str):
-                pattern = r"\$\{env:([^}]+)\}"
-                matches = re.findall(pattern, value)
-                env_vars.extend(matches)
-            elif isinstance(value, dict):
-                for v in value.values():
-                    env_vars.extend(extract_env_vars(v))
-            elif isinstance(value, list):
-                for item in value:
-                    env_vars.extend(extract_env_vars(item))
-            return env_vars
-
         # Extract all environment variables from config
-        config_dict = config.model_dump()
-        required_vars = extract_env_vars(config_dict)
+        required_vars = find_env_vars(config.model_dump())
 
         # Check if each variable is set
-        for var in set(required_vars):
+        for var in required_vars:
             if os.getenv(var) is None:
                 missing_vars.append(var)
 
@@ -217,9 +232,11 @@ class ConfigLoader:
         Args:
             output_path: Path where to save the example configuration
         """
+        import yaml
+
         example_config = ConfigLoader.create_example_config()
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_file, "w", encoding="utf-8") as f:
-            yaml.dump(example_config, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(example_config, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), default_flow_style=False, sort_keys=False, indent=2)
@@ -4,7 +4,7 @@ Model configuration classes.
 
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from .base import EnvSubstitutionMixin
 
@@ -12,6 +12,8 @@ from .base import EnvSubstitutionMixin
 class ModelConfig(BaseModel, EnvSubstitutionMixin):
     """Configuration for AI models."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str = Field(..., description="Model provider (e.g., azure_openai, openai)")
     id: str = Field(..., description="Model identifier")
     version: str = Field(..., description="Model version")
@@ -2,9 +2,10 @@
 Tool configuration classes.
 """
 
+import os
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.types import PositiveInt
 
 from .base import EnvSubstitutionMixin
@@ -32,8 +33,6 @@ class OpenAPIToolConfig(BaseModel, EnvSubstitutionMixin):
         """Set default name and description if not provided."""
         if self.name is None:
             # Extract name from schema_path or use a default
-            import os
-
             schema_name = os.path.splitext(os.path.basename(self.schema_path))[0]
             self.name = schema_name if schema_name else "openapi_tool"
 
@@ -46,9 +45,9 @@ class OpenAPIToolConfig(BaseModel, EnvSubstitutionMixin):
     @classmethod
     def validate_schema_path(cls, v: str) -> str:
         """Validate that schema path exists."""
-        if not v.startswith("/") and not v.startswith("tools/"):
+        if not v.startswith(("/", "tools/")):
             # Assume relative path from config directory
-            v = f"tools/{v}" if not v.startswith("tools/") else v
+            v = f"tools/{v}"
         return v
 
 
@@ -61,7 +60,7 @@ class AIFoundryToolConfig(BaseModel, EnvSubstitutionMixin):
     type: Optional[str] = Field(None, description="Tool type (e.g., bing, openapi)")
     schema_path: Optional[str] = Field(None, description="Path to schema file for openapi tools")
     container_name: Optional[str] = Field(None, description="Container name for the tool")
-    connection_ids: Union[List[str], Dict[str, str]] = Field(default_factory=lambda: [], description="Connection IDs (list or dict)")
+    connection_ids: Union[List[str], Dict[str, str]] = Field(default_factory=dict, description="Connection IDs (list or dict)")
     config: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional configuration")
 
     @model_validator(mode="before")
@@ -72,7 +71,7 @@ class AIFoundryToolConfig(BaseModel, EnvSubstitutionMixin):
 
     @model_validator(mode="after")
     def set_defaults_and_normalize(self) -> "AIFoundryToolConfig":
-        """Set default values and normalize connection_ids format."""
+        """Set default name and description if not provided."""
         # Set default name if not provided
         if self.name is None:
             self.name = "ai_foundry_tool"
@@ -81,25 +80,22 @@ class AIFoundryToolConfig(BaseModel, EnvSubstitutionMixin):
         if self.description is None:
             self.description = f"AI Foundry tool: {self.name}"
 
-        # Normalize connection_ids from list to dict if needed
-        if isinstance(self.connection_ids, list):
-            if len(self.connection_ids) == 1:
-                # Single connection, use 'default' as key
-                self.connection_ids = {"default": self.connection_ids[0]}
-            else:
-                # Multiple connections, use index-based keys
-                self.connection_ids = {f"connection_{i}": conn_id for i, conn_id in enumerate(self.connection_ids)}
-
         return self
 
     @field_validator("connection_ids", mode="before")
     @classmethod
     def validate_connection_ids_input(cls, v: Union[List[str], Dict[str, str]]) -> Union[List[str], Dict[str, str]]:
-        """Validate connection IDs input format."""
+        """Validate connection IDs input format and normalize lists to a dict."""
         if isinstance(v, list):
             for item in v:
                 if not isinstance(item, str):
                     raise ValueError("Connection IDs in list must be strings")
+            # Normalize here so the core schema stores the final dict directly
+            if len(v) == 1:
+                # Single connection, use 'default' as key
+                return {"default": v[0]}
+            # Multiple connections, use index-based keys
+            return {f"connection_{i}": conn_id for i, conn_id in enumerate(v)}
         elif isinstance(v, dict):
             for key, value in v.items():
                 if not isinstance(key, str) or not isinstance(value, str):
@@ -112,6 +108,8 @@ class AIFoundryToolConfig(BaseModel, EnvSubstitutionMixin):
 class AIFoundryToolsConfig(BaseModel, EnvSubstitutionMixin):
     """Configuration for AI Foundry tools collection."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_project_endpoint: Optional[str] = Field(None, description="Default project endpoint for AI Foundry")
     tools: Dict[str, AIFoundryToolConfig] = Field(default_factory=dict, description="AI Foundry tools")
 
@@ -125,6 +123,8 @@ class AIFoundryToolsConfig(BaseModel, EnvSubstitutionMixin):
 class ToolsConfig(BaseModel, EnvSubstitutionMixin):
     """Main tools configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     openapi: Dict[str, OpenAPIToolConfig] = Field(default_factory=dict, description="OpenAPI tools")
     ai_foundry: AIFoundryToolsConfig = Field(
         default_factory=lambda: AIFoundryToolsConfig(default_project_endpoint=None, tools={}),
@@ -28,11 +28,94 @@ Run this script to see the library in action:
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from app.agents_config.ai_config import AIConfig
 from app.agents_config.config_loader import ConfigLoader
 
+# Environment variables referenced by app/ai-config/ai-config.yaml
+_LOAD_DEMO_ENV: Dict[str, str] = {
+    "AZURE_OPENAI_KEY": "demo-key-for-testing",
+    "AZURE_OPENAI_ENDPOINT": "https://demo.openai.azure.com/",
+    "AZURE_AI_FOUNDRY_PROJECT_ENDPOINT": "https://demo.foundry.com/",
+    "BING_SEARCH_CONNECTION_ID": "demo-bing-connection",
+    "OPOINT_API_CONNECTION_ID": "demo-opoint-connection",
+    "OPENAPI_OPOINT_API_KEY": "demo-opoint-key",
+}
+
+# Environment variables for the programmatic configuration demo
+_PROGRAMMATIC_DEMO_ENV: Dict[str, str] = {
+    "DEMO_API_KEY": "demo-api-key-12345",
+    "DEMO_ENDPOINT": "https://demo-programmatic.openai.azure.com/",
+    "DEMO_TOOL_KEY": "demo-tool-key-67890",
+}
+
+# Environment variables for the substitution demo
+_SUBSTITUTION_DEMO_ENV: Dict[str, str] = {
+    "DEMO_API_KEY": "demo-key-12345",
+    "DEMO_ENDPOINT": "https://demo.openai.azure.com/",
+}
+
+# Environment variables shared by all demos
+_MAIN_DEMO_ENV: Dict[str, str] = {
+    "AZURE_OPENAI_API_KEY": "demo-key-12345",
+    "AZURE_OPENAI_ENDPOINT": "https://demo.openai.azure.com",
+    "DEMO_API_KEY": "demo-secret-key",
+    "BING_CONNECTION_ID": "bing-conn-123",
+}
+
+# Minimal configuration that validates without any environment variables
+_SIMPLE_CONFIG: Dict[str, Any] = {
+    "version": "1.0",
+    "models": {
+        "simple-model": {
+            "provider": "azure_openai",
+            "id": "gpt-4",
+            "version": "1.0",
+            "config": {
+                "api_key": "demo-key-for-testing",
+                "endpoint": "https://demo.openai.azure.com/",
+                "deployment": "demo-deployment",
+                "api_version": "2024-02-15-preview",
+            },
+            "params": {"temperature": 0.7, "max_tokens": 1000},
+        }
+    },
+    "tools": {},
+    "agents": {
+        "simple-agent": {
+            "version": "1.0",
+            "name": "Simple Agent",
+            "description": "A simple demonstration agent",
+            "model": {"name": "simple-model", "temperature": 0.5},
+            "tools": [],
+            "platform": "azure_openai",
+            "system_prompt": {"version": "1.0", "path": "prompts/simple-agent.md"},
+        }
+    },
+}
+
+# Configuration with deliberate errors for the validation demo
+_INVALID_CONFIG: Dict[str, Any] = {
+    "version": "1.0",
+    "models": {
+        "invalid-model": {
+            "provider": "invalid_provider",  # Invalid provider
+            "id": "",  # Empty ID
+            "config": "not_a_dict",  # Should be dict
+        }
+    },
+    "agents": {
+        "invalid-agent": {
+            "name": "Test Agent",
+            "model": {
+                # References non-existent model
+                "name": "non-existent-model"
+            },
+        }
+    },
+}
+
 
 def demo_load_existing_config() -> Optional[AIConfig]:
     """Demonstrate loading an existing configuration file."""
@@ -41,12 +124,7 @@ def demo_load_existing_config() -> Optional[AIConfig]:
     config_path = "app/ai-config/ai-config.yaml"
 
     # Set minimal environment variables for demo
-    os.environ["AZURE_OPENAI_KEY"] = "demo-key-for-testing"
-    os.environ["AZURE_OPENAI_ENDPOINT"] = "https://demo.openai.azure.com/"
-    os.environ["AZURE_AI_FOUNDRY_PROJECT_ENDPOINT"] = "https://demo.foundry.com/"
-    os.environ["BING_SEARCH_CONNECTION_ID"] = "demo-bing-connection"
-    os.environ["OPOINT_API_CONNECTION_ID"] = "demo-opoint-connection"
-    os.environ["OPENAPI_OPOINT_API_KEY"] = "demo-opoint-key"
+    os.environ.update(_LOAD_DEMO_ENV)
 
     print(f"   Attempting to load: {config_path}")
     print("   Note: The existing config has complex tool definitions that")
@@ -55,72 +133,64 @@ def demo_load_existing_config() -> Optional[AIConfig]:
     try:
         # Load configuration from file
         config = ConfigLoader.load_from_file(config_path)
-        print(f"✅ Successfully loaded configuration from {config_path}")
-        print(f"   Version: {config.version}")
-        print(f"   Models: {len(config.models)} available")
-        print(f"   Agents: {len(config.agents)} available")
-
-        # List available models
-        print("\n📊 Available Models:")
-        for model_name in config.list_models():
-            model = config.get_model(model_name)
-            if model:
-                print(f"   - {model_name}: {model.provider} ({model.id})")
-            else:
-                print(f"   - {model_name}: (model not found)")
-
-        # List available agents
-        print("\n🤖 Available Agents:")
-        for agent_name in config.list_agents():
-            agent = config.get_agent(agent_name)
-            if agent:
-                print(f"   - {agent_name}: {agent.description}")
-                if agent.model:
-                    model_name = agent.model.name
-                    temp = agent.model.temperature
-                    print(f"     Model: {model_name} (temp: {temp})")
-                if agent.tools:
-                    tools_str = ", ".join(agent.tools)
-                    print(f"     Tools: {tools_str}")
-            else:
-                print(f"   - {agent_name}: (agent not found)")
-
-        # Display reference resolution examples
-        print("\n🔗 Reference Resolution Examples:")
-
-        # Show how ${ref:} references were resolved
-        if hasattr(config.tools, "ai_foundry"):
-            ai_foundry = config.tools.ai_foundry
-            endpoint = getattr(ai_foundry, "default_project_endpoint", "not found")
-            print("   ${ref:tools.ai_foundry.default_project_endpoint} →")
-            print(f"     Resolved to: {endpoint}")
-
-            if hasattr(ai_foundry, "tools") and isinstance(ai_foundry.tools, dict):
-                for tool_name, tool_config in ai_foundry.tools.items():
-                    if hasattr(tool_config, "config") and isinstance(tool_config.config, dict):
-                        project_endpoint = tool_config.config.get("project_endpoint")
-                        if project_endpoint:
-                            print(f"   Tool '{tool_name}' project_endpoint:")
-                            print("     Original: ${ref:tools.ai_foundry." "default_project_endpoint}")
-                            print(f"     Resolved: {project_endpoint}")
-
-        # Show agent tool references
-        print("\n🔧 Agent Tool Reference Resolution:")
-        for agent_name in config.list_agents():
-            agent = config.get_agent(agent_name)
-            if agent and agent.tools:
-                print(f"   Agent '{agent_name}' tools:")
+        print(
+            f"✅ Successfully loaded configuration from {config_path}\n"
+            f"   Version: {config.version}\n"
+            f"   Models: {len(config.models)} available\n"
+            f"   Agents: {len(config.agents)} available"
+        )
+
+        # List available models; each section is buffered and printed once
+        lines: List[str] = ["\n📊 Available Models:"]
+        lines.extend(f"   - {model_name}: {model.provider} ({model.id})" for model_name, model in config.models.items())
+        print("\n".join(lines))
+
+        # List available agents and their tool references in a single pass
+        lines = ["\n🤖 Available Agents:"]
+        tool_lines = ["\n🔧 Agent Tool Reference Resolution:"]
+        for agent_name, agent in config.agents.items():
+            lines.append(f"   - {agent_name}: {agent.description}")
+            if agent.model:
+                model_name = agent.model.name
+                temp = agent.model.temperature
+                lines.append(f"     Model: {model_name} (temp: {temp})")
+            if agent.tools:
+                tools_str = ", ".join(agent.tools)
+                lines.append(f"     Tools: {tools_str}")
+
+                # Show agent tool references
+                tool_lines.append(f"   Agent '{agent_name}' tools:")
                 for tool_ref in agent.tools:
                     if tool_ref.startswith("${ref:"):
                         # Show original reference format
-                        print(f"     Original: {tool_ref}")
+                        tool_lines.append(f"     Original: {tool_ref}")
                         # Try to show what it resolved to
-                        ref_path = tool_ref.replace("${ref:", "").replace("}", "")
-                        print(f"     Reference path: {ref_path}")
+                        ref_path = tool_ref.removeprefix("${ref:").removesuffix("}")
+                        tool_lines.append(f"     Reference path: {ref_path}")
                         # Show that it was resolved to an actual tool config
-                        print("     Resolved: ✅ Tool configuration object")
+                        tool_lines.append("     Resolved: ✅ Tool configuration object")
                     else:
-                        print(f"     Tool: {tool_ref}")
+                        tool_lines.append(f"     Tool: {tool_ref}")
+        print("\n".join(lines))
+
+        # Display reference resolution examples
+        lines = ["\n🔗 Reference Resolution Examples:"]
+
+        # Show how ${ref:} references were resolved
+        ai_foundry = config.tools.ai_foundry
+        lines.append("   ${ref:tools.ai_foundry.default_project_endpoint} →")
+        lines.append(f"     Resolved to: {ai_foundry.default_project_endpoint}")
+
+        for tool_name, tool_config in ai_foundry.tools.items():
+            project_endpoint = tool_config.config.get("project_endpoint") if tool_config.config else None
+            if project_endpoint:
+                lines.append(f"   Tool '{tool_name}' project_endpoint:")
+                lines.append("     Original: ${ref:tools.ai_foundry." "default_project_endpoint}")
+                lines.append(f"     Resolved: {project_endpoint}")
+        print("\n".join(lines))
+
+        # Agent tool references were collected with the agent listing above
+        print("\n".join(tool_lines))
 
         return config
 
@@ -136,38 +206,8 @@ def demo_load_existing_config() -> Optional[AIConfig]:
 
 def demo_create_simple_working_config() -> Optional[AIConfig]:
     """Create a simple configuration that will definitely work."""
-    simple_config_dict: Dict[str, Any] = {
-        "version": "1.0",
-        "models": {
-            "simple-model": {
-                "provider": "azure_openai",
-                "id": "gpt-4",
-                "version": "1.0",
-                "config": {
-                    "api_key": "demo-key-for-testing",
-                    "endpoint": "https://demo.openai.azure.com/",
-                    "deployment": "demo-deployment",
-                    "api_version": "2024-02-15-preview",
-                },
-                "params": {"temperature": 0.7, "max_tokens": 1000},
-            }
-        },
-        "tools": {},
-        "agents": {
-            "simple-agent": {
-                "version": "1.0",
-                "name": "Simple Agent",
-                "description": "A simple demonstration agent",
-                "model": {"name": "simple-model", "temperature": 0.5},
-                "tools": [],
-                "platform": "azure_openai",
-                "system_prompt": {"version": "1.0", "path": "prompts/simple-agent.md"},
-            }
-        },
-    }
-
     try:
-        config = ConfigLoader.load_from_dict(simple_config_dict)
+        config = ConfigLoader.load_from_dict(_SIMPLE_CONFIG)
         print("   ✅ Simple configuration loaded successfully!")
         print(f"      Models: {len(config.models)}")
         print(f"      Agents: {len(config.agents)}")
@@ -185,12 +225,11 @@ def demo_validate_environment_variables(config: AIConfig) -> None:
     missing_vars = ConfigLoader.validate_environment_variables(config)
 
     if missing_vars:
-        print("⚠️  Missing environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        print("\n💡 To use the full functionality, set these environment variables:")
-        for var in missing_vars:
-            print(f"   export {var}=your_value_here")
+        lines = ["⚠️  Missing environment variables:"]
+        lines.extend(f"   - {var}" for var in missing_vars)
+        lines.append("\n💡 To use the full functionality, set these environment variables:")
+        lines.extend(f"   export {var}=your_value_here" for var in missing_vars)
+        print("\n".join(lines))
     else:
         print("✅ All required environment variables are set!")
 
@@ -200,9 +239,7 @@ def demo_create_programmatic_config() -> Optional[AIConfig]:
     print("\n🏗️  Demo: Creating configuration programmatically...")
 
     # Set demo environment variables for this function
-    os.environ["DEMO_API_KEY"] = "demo-api-key-12345"
-    os.environ["DEMO_ENDPOINT"] = "https://demo-programmatic.openai.azure.com/"
-    os.environ["DEMO_TOOL_KEY"] = "demo-tool-key-67890"
+    os.environ.update(_PROGRAMMATIC_DEMO_ENV)
 
     # Create a simple configuration dictionary
     config_dict: Dict[str, Any] = {
@@ -277,8 +314,9 @@ def demo_save_example_config() -> Optional[str]:
         print(f"✅ Example configuration saved to {example_path}")
 
         # Verify the saved file exists
-        if Path(example_path).exists():
-            file_size = Path(example_path).stat().st_size
+        example_file = Path(example_path)
+        if example_file.exists():
+            file_size = example_file.stat().st_size
             print(f"   File size: {file_size} bytes")
 
         return example_path
@@ -293,28 +331,8 @@ def demo_configuration_validation() -> None:
     print("\n🔍 Demo: Configuration validation...")
 
     # Test with invalid configuration
-    invalid_config: Dict[str, Any] = {
-        "version": "1.0",
-        "models": {
-            "invalid-model": {
-                "provider": "invalid_provider",  # Invalid provider
-                "id": "",  # Empty ID
-                "config": "not_a_dict",  # Should be dict
-            }
-        },
-        "agents": {
-            "invalid-agent": {
-                "name": "Test Agent",
-                "model": {
-                    # References non-existent model
-                    "name": "non-existent-model"
-                },
-            }
-        },
-    }
-
     try:
-        _ = ConfigLoader.load_from_dict(invalid_config)
+        _ = ConfigLoader.load_from_dict(_INVALID_CONFIG)
         print("❌ Validation should have failed!")
     except Exception as e:
         print(f"✅ Validation correctly caught error: {type(e).__name__}")
@@ -324,12 +342,12 @@ def demo_configuration_validation() -> None:
             # Split by common error patterns and show first few errors
             if "validation error" in error_str.lower():
                 lines = error_str.split("\n")
-                print("   Error details:")
-                for i, line in enumerate(lines[:8]):  # Show first 8 lines
-                    if line.strip():
-                        print(f"     {line}")
+                details = ["   Error details:"]
+                # Show first 8 lines
+                details.extend(f"     {line}" for line in lines[:8] if line.strip())
                 if len(lines) > 8:
-                    print("     ... (additional validation errors truncated)")
+                    details.append("     ... (additional validation errors truncated)")
+                print("\n".join(details))
             else:
                 print(f"   Error details: {error_str[:300]}...")
         else:
@@ -341,8 +359,7 @@ def demo_environment_substitution() -> None:
     print("\n🔄 Demo: Environment variable substitution...")
 
     # Set some demo environment variables
-    os.environ["DEMO_API_KEY"] = "demo-key-12345"
-    os.environ["DEMO_ENDPOINT"] = "https://demo.openai.azure.com/"
+    os.environ.update(_SUBSTITUTION_DEMO_ENV)
 
     config_with_env: Dict[str, Any] = {
         "version": "1.0",
@@ -381,9 +398,10 @@ def cleanup_demo_files() -> None:
 
     demo_files = ["example-ai-config.yaml"]
     for file_path in demo_files:
-        if Path(file_path).exists():
+        demo_file = Path(file_path)
+        if demo_file.exists():
             try:
-                Path(file_path).unlink()
+                demo_file.unlink()
                 print(f"   Removed {file_path}")
             except Exception as e:
                 print(f"   Failed to remove {file_path}: {e}")
@@ -457,15 +475,12 @@ def demo_reference_resolution() -> None:
         print("\n✅ Configuration loaded successfully with reference resolution!")
 
         # Show resolved values
-        if hasattr(config.tools, "ai_foundry"):
-            endpoint = getattr(config.tools.ai_foundry, "default_project_endpoint", "not found")
-            print(f"  Resolved endpoint: {endpoint}")
+        ai_foundry = config.tools.ai_foundry
+        print(f"  Resolved endpoint: {ai_foundry.default_project_endpoint}")
 
-            if hasattr(config.tools.ai_foundry, "tools"):
-                tools_dict = config.tools.ai_foundry.tools
-                if isinstance(tools_dict, dict) and "opoint" in tools_dict:
-                    tool_ref = tools_dict["opoint"]
-                    print(f"  Resolved tool reference: {tool_ref}")
+        tool_ref = ai_foundry.tools.get("opoint")
+        if tool_ref is not None:
+            print(f"  Resolved tool reference: {tool_ref}")
 
         # Show agent tools
         if "office_agent" in config.agents:
@@ -485,10 +500,7 @@ def main() -> None:
     print("=" * 50)
 
     # Set up environment variables for demo
-    os.environ["AZURE_OPENAI_API_KEY"] = "demo-key-12345"
-    os.environ["AZURE_OPENAI_ENDPOINT"] = "https://demo.openai.azure.com"
-    os.environ["DEMO_API_KEY"] = "demo-secret-key"
-    os.environ["BING_CONNECTION_ID"] = "bing-conn-123"
+    os.environ.update(_MAIN_DEMO_ENV)
 
     demo_load_existing_config()
     demo_create_programmatic_config()
@@ -1,5 +1,8 @@
 """Basic tests for agents-config package."""
 
+from pathlib import Path
+from typing import Any, Dict
+
 import pytest
 
 from app.agents_config.ai_config import AIConfig
@@ -39,7 +42,7 @@ def test_environment_variable_substitution() -> None:
     # Set test environment variable
     os.environ["TEST_API_KEY"] = "test-key-123"
 
-    config_dict = {
+    config_dict: Dict[str, Any] = {
         "version": "1.0",
         "models": {"test-model": {"provider": "azure_openai", "id": "gpt-4", "version": "1.0", "config": {"api_key": "${env:TEST_API_KEY}"}}},
         "agents": {},
@@ -50,11 +53,22 @@ def test_environment_variable_substitution() -> None:
 
     # Verify substitution occurred - access through config dict
     assert config.models["test-model"].config["api_key"] == "test-key-123"
+    # The caller's dict is left untouched
+    assert config_dict["models"]["test-model"]["config"]["api_key"] == "${env:TEST_API_KEY}"
 
     # Clean up
     del os.environ["TEST_API_KEY"]
 
 
+def test_find_env_vars() -> None:
+    """Test that referenced environment variable names are found in nested values."""
+    from app.agents_config.base import find_env_vars
+
+    value = {"a": ["${env:FIRST} and ${env:SECOND}", {"b": "${env:FIRST}"}], "c": "plain", "d": 1}
+
+    assert find_env_vars(value) == {"FIRST", "SECOND"}
+
+
 def test_reference_resolution() -> None:
     """Test internal reference resolution."""
     config_dict = {
@@ -86,5 +100,117 @@ def test_reference_resolution() -> None:
     assert config.agents["test-agent"].platform == "azure_openai"
 
 
+def test_reference_to_container_does_not_alias_input() -> None:
+    """Test that a reference resolving to a dict is copied, not shared with the input."""
+    config_dict: Dict[str, Any] = {
+        "version": "1.0",
+        "shared": {"opts": {"retries": 3}},
+        "models": {"test-model": {"provider": "azure_openai", "id": "gpt-4", "version": "1.0", "config": {"extra": "shared.opts"}}},
+        "agents": {},
+        "tools": {},
+    }
+
+    config = ConfigLoader.load_from_dict(config_dict)
+    config.models["test-model"].config["extra"]["retries"] = 999
+
+    # The caller's dict is left untouched
+    assert config_dict["shared"]["opts"]["retries"] == 3
+
+
+def test_unknown_model_reference() -> None:
+    """Test that agents referencing unknown models are rejected."""
+    config_dict = {
+        "version": "1.0",
+        "models": {},
+        "agents": {
+            "test-agent": {
+                "version": "1.0",
+                "name": "test-agent",
+                "description": "Test agent",
+                "model": {"name": "missing-model"},
+                "platform": "azure_openai",
+                "system_prompt": {"version": "1.0", "path": "test.md"},
+            }
+        },
+        "tools": {},
+    }
+
+    with pytest.raises(ValueError, match="unknown model 'missing-model'"):
+        ConfigLoader.load_from_dict(config_dict)
+
+
+def test_connection_ids_normalization() -> None:
+    """Test that connection ID lists are normalized to dicts."""
+    from app.agents_config.tool_config import AIFoundryToolConfig
+
+    assert AIFoundryToolConfig.model_validate({"connection_ids": []}).connection_ids == {}
+    assert AIFoundryToolConfig.model_validate({"connection_ids": ["a"]}).connection_ids == {"default": "a"}
+    assert AIFoundryToolConfig.model_validate({"connection_ids": ["a", "b"]}).connection_ids == {"connection_0": "a", "connection_1": "b"}
+    assert AIFoundryToolConfig.model_validate({}).connection_ids == {}
+
+
+def test_cyclic_yaml_is_rejected(tmp_path: Path) -> None:
+    """Test that a YAML document containing itself raises instead of looping forever."""
+    config_file = tmp_path / "ai-config.yaml"
+    config_file.write_text("a: &x [*x]\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="cyclic reference"):
+        ConfigLoader.load_from_file(str(config_file))
+
+
+def test_load_from_file_picks_up_changes(tmp_path: Path) -> None:
+    """Test that a cached YAML document is re-parsed after a same-size edit."""
+    import os
+
+    config_file = tmp_path / "ai-config.yaml"
+    config_file.write_text("version: '1.0'\n", encoding="utf-8")
+    assert ConfigLoader.load_from_file(str(config_file)).version == "1.0"
+
+    mtime_ns = config_file.stat().st_mtime_ns
+    config_file.write_text("version: '2.0'\n", encoding="utf-8")
+    # Force a different mtime even on filesystems with coarse timestamps
+    os.utime(config_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert ConfigLoader.load_from_file(str(config_file)).version == "2.0"
+
+
+def test_clear_cache(tmp_path: Path) -> None:
+    """Test that clear_cache makes load_from_file parse the file again."""
+    from app.agents_config import config_loader
+
+    config_file = tmp_path / "ai-config.yaml"
+    config_file.write_text("version: '1.0'\n", encoding="utf-8")
+    ConfigLoader.load_from_file(str(config_file))
+    assert str(config_file.resolve()) in config_loader._PARSED_YAML_CACHE
+
+    ConfigLoader.clear_cache()
+    assert not config_loader._PARSED_YAML_CACHE
+    assert ConfigLoader.load_from_file(str(config_file)).version == "1.0"
+
+
+def test_load_from_file_cache_does_not_leak_edits(tmp_path: Path) -> None:
+    """Test that editing a loaded config does not change later loads of the same file."""
+    config_file = tmp_path / "ai-config.yaml"
+    config_file.write_text(
+        "version: '1.0'\n"
+        "shared:\n"
+        "  opts:\n"
+        "    retries: 3\n"
+        "models:\n"
+        "  test-model:\n"
+        "    provider: azure_openai\n"
+        "    id: gpt-4\n"
+        "    version: '1.0'\n"
+        "    config:\n"
+        "      extra: shared.opts\n",
+        encoding="utf-8",
+    )
+
+    config = ConfigLoader.load_from_file(str(config_file))
+    config.models["test-model"].config["extra"]["retries"] = 999
+
+    reloaded = ConfigLoader.load_from_file(str(config_file))
+    assert reloaded.models["test-model"].config["extra"]["retries"] == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__])